@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MiniDSPAPI
 from .const import DOMAIN
@@ -37,14 +37,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Config entry missing base URL")
         raise ConfigEntryNotReady
 
-    session = async_get_clientsession(hass)
-    api = MiniDSPAPI(base_url, session)
+    api = MiniDSPAPI(base_url)
     coordinator = MiniDSPCoordinator(hass, api, name=entry.title)
 
     try:
-        await coordinator.async_config_entry_first_refresh()
-        await coordinator.async_start()
+        # Kick off the websocket subscription while the first status fetch
+        # is in flight; the callback merges into whatever data exists.
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            coordinator.async_start(),
+        )
     except Exception as err:
+        # The API owns its aiohttp session and may already have spawned the
+        # websocket task; tear both down or every setup retry leaks them
+        await api.async_disconnect()
         raise ConfigEntryNotReady from err
 
     # Store
@@ -53,12 +59,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "api": api,
     }
 
-    # Forward media_player first to make it appear first in UI entity list
-    await hass.config_entries.async_forward_entry_setups(entry, ["media_player"])
-    # Forward remaining platforms
-    await hass.config_entries.async_forward_entry_setups(
-        entry, [p for p in PLATFORMS if p != "media_player"]
-    )
+    # Forward all platforms in one call; HA sets them up concurrently while
+    # preserving the list order (media_player first) for the entity list
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
@@ -1,30 +1,64 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any, Callable, Coroutine
 
 import aiohttp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 _LOGGER = logging.getLogger(__name__)
 
+# http(s) schemes map to their websocket equivalents
+_WS_SCHEMES = {"https": "wss", "http": "ws", "tcp": "ws"}
+
+# Window for merging rapid master_status changes into a single POST
+_MASTER_FLUSH_DELAY = 0.05
+
 
 class MiniDSPAPI:
     """Simple async wrapper around the minidsp-rs HTTP & WebSocket API."""
 
-    def __init__(
-        self, base_url: str, session: aiohttp.ClientSession, device_index: int = 0
-    ):
+    def __init__(self, base_url: str, device_index: int = 0):
         # Normalise base url (strip trailing slash)
         self._base_url = base_url.rstrip("/")
-        self._session = session
+        # Use a dedicated session with a connector tuned for a single host so
+        # status GETs, config POSTs and the websocket all reuse warm
+        # keep-alive connections instead of competing in the shared HA pool.
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=4,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            headers={"Connection": "keep-alive"},
+        )
         self._device_index = device_index
         self._ws_task: asyncio.Task | None = None
-        self._listeners: list[
+        # A set gives O(1) unsubscribe; dispatch order is not significant
+        self._listeners: set[
             Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
-        ] = []
+        ] = set()
         self._stop_event = asyncio.Event()
+        # The base URL never changes, so build the websocket URL once
+        self._ws_url = self._build_ws_url()
+        # Serialize config POSTs and coalesce master_status fields so a
+        # burst of UI actions results in one request instead of N
+        self._post_lock = asyncio.Lock()
+        self._pending_master: dict[str, Any] = {}
+        self._master_flush_task: asyncio.Task | None = None
 
     # ---------------------------------------------------------------------
     # Public helpers
@@ -35,35 +69,69 @@ class MiniDSPAPI:
         url = f"{self._base_url}/devices/{self._device_index}"
         async with self._session.get(url) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            # Parse the raw bytes directly; orjson skips the UTF-8 decode
+            # that resp.json() would perform with the stdlib parser.
+            return _json_loads(await resp.read())
 
     async def async_post_config(self, payload: dict[str, Any]) -> None:
         """POST configuration changes to the device."""
         url = f"{self._base_url}/devices/{self._device_index}/config"
-        async with self._session.post(url, json=payload) as resp:
+        # Serialize explicitly so aiohttp doesn't fall back to stdlib json
+        async with self._session.post(
+            url,
+            data=_json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+        ) as resp:
             resp.raise_for_status()
 
     # ----------------------- convenience setters ------------------------
 
     async def async_set_volume(self, gain: float) -> None:
-        await self.async_post_config({"master_status": {"volume": gain}})
+        await self._async_queue_master("volume", gain)
 
     async def async_set_mute(self, mute: bool) -> None:
-        await self.async_post_config({"master_status": {"mute": mute}})
+        await self._async_queue_master("mute", mute)
 
     async def async_set_dirac(self, enabled: bool) -> None:
-        await self.async_post_config({"master_status": {"dirac": enabled}})
+        await self._async_queue_master("dirac", enabled)
 
     async def async_set_source(self, source: str) -> None:
-        await self.async_post_config({"master_status": {"source": source}})
+        await self._async_queue_master("source", source)
 
     async def async_set_preset(self, preset: int) -> None:
-        await self.async_post_config({"master_status": {"preset": preset}})
+        await self._async_queue_master("preset", preset)
 
     async def async_set_output_gain(self, output_index: int, gain: float) -> None:
-        await self.async_post_config(
-            {"outputs": [{"index": output_index, "gain": gain}]}
-        )
+        async with self._post_lock:
+            await self.async_post_config(
+                {"outputs": [{"index": output_index, "gain": gain}]}
+            )
+
+    async def _async_queue_master(self, field: str, value: Any) -> None:
+        """Buffer a master_status field and await the coalesced POST.
+
+        All setters in the same window share a single request, and every
+        caller awaits it, so a failed POST raises in each caller instead
+        of vanishing inside a detached task.
+        """
+        self._pending_master[field] = value
+        if self._master_flush_task is None:
+            self._master_flush_task = asyncio.create_task(self._flush_master())
+        # Shield: one cancelled caller must not abort the shared POST
+        await asyncio.shield(self._master_flush_task)
+
+    async def _flush_master(self) -> None:
+        try:
+            # Keep draining so fields queued while a POST is in flight are
+            # sent in a follow-up request rather than dropped
+            while self._pending_master:
+                await asyncio.sleep(_MASTER_FLUSH_DELAY)
+                async with self._post_lock:
+                    pending = self._pending_master
+                    self._pending_master = {}
+                    await self.async_post_config({"master_status": pending})
+        finally:
+            self._master_flush_task = None
 
     # ----------------------- websocket handling -------------------------
 
@@ -76,48 +144,79 @@ class MiniDSPAPI:
         `output_levels` whenever a new message is received.
         Returns an unsubscribe callback.
         """
-        self._listeners.append(callback)
+        self._listeners.add(callback)
 
         if self._ws_task is None:
             self._ws_task = asyncio.create_task(self._ws_listener_task())
 
         def _unsubscribe() -> None:
-            if callback in self._listeners:
-                self._listeners.remove(callback)
+            self._listeners.discard(callback)
             if not self._listeners:
                 self._stop_event.set()
 
         return _unsubscribe
 
     async def async_disconnect(self) -> None:
-        """Cancel the websocket task (if any)."""
+        """Cancel the websocket task (if any) and close the session."""
+        if self._master_flush_task is not None:
+            # Let any buffered master_status flush finish before the session
+            # closes; RuntimeError covers a flush racing the close below
+            try:
+                await asyncio.shield(self._master_flush_task)
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                RuntimeError,
+            ) as err:
+                _LOGGER.warning("Failed to flush pending master_status: %s", err)
         if self._ws_task and not self._ws_task.done():
             self._stop_event.set()
-            await self._ws_task
+            # A task blocked in receive() on a live connection never checks
+            # the stop event; cancel as well so teardown cannot hang
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+        self._ws_task = None
+        # The session is owned by this API object, not the shared HA one
+        await self._session.close()
 
     # ---------------------------------------------------------------------
 
     async def _ws_listener_task(self) -> None:
         """Background task that maintains the websocket connection."""
-        ws_url = self._build_ws_url()
+        ws_url = self._ws_url
         backoff = 1.0
         while not self._stop_event.is_set():
             try:
                 _LOGGER.debug("Connecting to MiniDSP websocket at %s", ws_url)
                 async with self._session.ws_connect(ws_url, heartbeat=30) as ws:
                     backoff = 1.0  # Reset backoff after successful connect
-                    async for msg in ws:
-                        if msg.type == aiohttp.WSMsgType.TEXT:
+                    # Explicit receive() loop: binary frames skip the UTF-8
+                    # decode aiohttp performs for TEXT frames before parsing.
+                    while True:
+                        msg = await ws.receive()
+                        if msg.type in (
+                            aiohttp.WSMsgType.BINARY,
+                            aiohttp.WSMsgType.TEXT,
+                        ):
                             try:
-                                data = json.loads(msg.data)
-                            except json.JSONDecodeError as err:
+                                # orjson accepts both str and bytes payloads
+                                data = _json_loads(msg.data)
+                            except ValueError as err:
                                 _LOGGER.warning(
                                     "Failed to decode websocket message: %s", err
                                 )
                                 continue
-                            _LOGGER.debug("Websocket message: %s", data)
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug("Websocket message: %s", data)
                             await self._dispatch_event(data)
-                        elif msg.type == aiohttp.WSMsgType.CLOSED:
+                        elif msg.type in (
+                            aiohttp.WSMsgType.CLOSE,
+                            aiohttp.WSMsgType.CLOSING,
+                            aiohttp.WSMsgType.CLOSED,
+                        ):
                             _LOGGER.debug("Websocket closed")
                             break
                         elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -129,14 +228,23 @@ class MiniDSPAPI:
             if self._stop_event.is_set():
                 break
 
-            # Reconnect with exponential backoff
-            await asyncio.sleep(backoff)
+            # Reconnect with exponential backoff; waiting on the stop event
+            # keeps the sleep interruptible so shutdown is not delayed
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=backoff)
+                break
+            except asyncio.TimeoutError:
+                pass
             backoff = min(backoff * 2.0, 60.0)
 
         _LOGGER.debug("MiniDSP websocket listener stopped")
 
     async def _dispatch_event(self, event: dict[str, Any]) -> None:
-        for cb in list(self._listeners):
+        listeners = self._listeners
+        if not listeners:
+            return
+        # Snapshot so callbacks may unsubscribe during iteration
+        for cb in tuple(listeners):
             try:
                 await cb(event)
             except Exception as err:  # noqa: BLE001
@@ -146,20 +254,18 @@ class MiniDSPAPI:
 
     def _build_ws_url(self) -> str:
         """Convert the base_url to a websocket URL for streaming levels."""
-        # Convert http(s) to ws(s)
-        if self._base_url.startswith("https://"):
-            scheme = "wss://"
-            rest = self._base_url[len("https://") :]
-        elif self._base_url.startswith("http://"):
-            scheme = "ws://"
-            rest = self._base_url[len("http://") :]
-        elif self._base_url.startswith("tcp://"):
-            # minidsp-rs sometimes advertises tcp scheme; treat as ws
-            scheme = "ws://"
-            rest = self._base_url[len("tcp://") :]
+        scheme, sep, rest = self._base_url.partition("://")
+        if sep:
+            # minidsp-rs sometimes advertises a tcp scheme; treat as ws.
+            # Unknown schemes (ws://, wss://, ...) are passed through as-is.
+            scheme = _WS_SCHEMES.get(scheme, scheme)
+            rest = f"{scheme}://{rest}"
         else:
-            # Assume scheme already correct (ws:// or wss:// or tcp:// etc.)
-            scheme = ""
             rest = self._base_url
 
-        return f"{scheme}{rest}/devices/{self._device_index}?levels=true&poll=true"
+        # format=binary asks for binary frames where supported (the server
+        # silently ignores unknown query parameters otherwise)
+        return (
+            f"{rest}/devices/{self._device_index}"
+            "?levels=true&poll=true&format=binary"
+        )
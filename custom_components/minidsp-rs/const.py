@@ -1,8 +1,5 @@
 DOMAIN = "minidsp"
 
-# Default update interval for polling device status
-SCAN_INTERVAL_SECONDS = 1
-
 # Available source options as described in the OpenAPI schema
 SOURCES = [
     "Analog",
@@ -3,7 +3,11 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+import asyncio
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import MiniDSPAPI
@@ -11,8 +15,48 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-# Precision for level values
-# _ROUND_PRECISION = 0
+# Window for coalescing bursts of pure-level frames into one entity update
+_LEVEL_FLUSH_DELAY = 0.1
+
+# Keys whose values are numeric level arrays guaranteed by the protocol
+_LEVEL_KEYS = ("input_levels", "output_levels")
+
+# Shared fallback so the per-frame callback never allocates an empty dict
+_EMPTY: dict = {}
+
+
+def _fast_round(v: Any) -> Any:
+    """Round half-away-from-zero without round()'s banker's rounding/dispatch."""
+    if isinstance(v, (int, float)):
+        return int(v + 0.5) if v >= 0 else -int(-v + 0.5)
+    return v
+
+
+def get_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> MiniDSPCoordinator | None:
+    """Return the coordinator stored for a config entry, if any.
+
+    try/except keeps the common path free of the default-dict allocations
+    chained .get(..., {}) calls would make on every platform setup.
+    """
+    try:
+        return hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    except KeyError:
+        return None
+
+
+def _outputs_by_index(outputs: Any) -> dict[Any, Any]:
+    """Key the outputs list by channel index for O(1) entity lookups."""
+    return {o.get("index"): o for o in outputs if isinstance(o, dict)}
+
+
+# Dispatch once per value by concrete type instead of chained isinstance checks
+_ROUND_BY_TYPE: dict[type, Any] = {
+    list: lambda value: tuple(_fast_round(v) for v in value),
+    tuple: lambda value: tuple(_fast_round(v) for v in value),
+    dict: lambda value: {k: _fast_round(v) for k, v in value.items()},
+}
 
 
 class MiniDSPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -27,6 +71,17 @@ class MiniDSPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self._api = api
         self._unsubscribe_ws: callable | None = None
+        # Debounce state for bursty level frames
+        self._pending: dict[str, Any] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Coalesces bursts of post-command refresh requests into one fetch
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=0.3,
+            immediate=False,
+            function=self.async_request_refresh,
+        )
         # Expose to entities
         self.base_url = api._base_url  # pragma: no cover
         self.address = self.base_url  # alias for clarity
@@ -43,78 +98,137 @@ class MiniDSPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Start listening to websocket events."""
 
         async def _levels_callback(event: dict[str, Any]):
-            # Update only levels fields without re-fetching everything
-            current = dict(self.data or {})
-            updated = False
-            for key in ("input_levels", "output_levels"):
+            # Diff against the live state first and copy only on a real
+            # change (copy-on-write) — most pure-level frames repeat the
+            # previous values and should not allocate anything. _pending is
+            # a partial overlay holding ONLY coalesced level keys, never a
+            # full snapshot, so entity commands that write master/outputs
+            # optimistically via async_set_updated_data while a flush is
+            # pending cannot be reverted by stale data.
+            data = self.data or _EMPTY
+            pending = self._pending
+            level_changes: dict[str, Any] | None = None
+            current: dict[str, Any] | None = None
+
+            def _current_levels(key: str) -> Any:
+                if pending is not None and key in pending:
+                    return pending[key]
+                return data.get(key)
+
+            for key in _LEVEL_KEYS:
                 if key in event:
-                    new_list = [
-                        int(round(v)) if isinstance(v, (int, float)) else v
+                    # Level arrays are guaranteed numeric by the protocol;
+                    # tuples give faster equality checks than lists.
+                    new_levels = tuple(
+                        int(v + 0.5) if v >= 0 else -int(-v + 0.5)
                         for v in event[key]
-                    ]
-                    if new_list != current.get(key):
-                        current[key] = new_list
-                        updated = True
+                    )
+                    if new_levels != _current_levels(key):
+                        if level_changes is None:
+                            level_changes = {}
+                        level_changes[key] = new_levels
 
             # Handle master status updates
             if "master_status" in event or "master" in event:
                 incoming_master = event.get("master_status") or event.get("master")
                 if isinstance(incoming_master, dict):
-                    if "master" not in current or not isinstance(
-                        current["master"], dict
-                    ):
-                        current["master"] = {}
+                    old_master = data.get("master")
+                    if not isinstance(old_master, dict):
+                        old_master = {}
 
                     # Round numeric fields and merge
-                    merged_master = dict(current["master"])
+                    merged_master = dict(old_master)
                     for m_key, m_val in incoming_master.items():
-                        if isinstance(m_val, (int, float)):
-                            m_val = int(round(m_val))
-                        merged_master[m_key] = m_val
+                        merged_master[m_key] = _fast_round(m_val)
 
-                    if merged_master != current["master"]:
+                    if merged_master != old_master:
+                        if current is None:
+                            current = dict(data)
                         current["master"] = merged_master
-                        updated = True
 
             # Handle outputs updates
             if "outputs" in event and isinstance(event["outputs"], list):
+                if current is None:
+                    current = dict(data)
                 current["outputs"] = event["outputs"]
-                updated = True
+                current["outputs_by_index"] = _outputs_by_index(event["outputs"])
 
             # Nested levels dict
             if "levels" in event and isinstance(event["levels"], dict):
-                for key in ("input_levels", "output_levels"):
+                for key in _LEVEL_KEYS:
                     if key in event["levels"]:
-                        new_list = [
-                            int(round(v)) if isinstance(v, (int, float)) else v
+                        new_levels = tuple(
+                            int(v + 0.5) if v >= 0 else -int(-v + 0.5)
                             for v in event["levels"][key]
-                        ]
-                        if new_list != current.get(key):
-                            current[key] = new_list
-                            updated = True
-
-            if updated:
-                # Push incremental update to listeners
+                        )
+                        if new_levels != _current_levels(key):
+                            if level_changes is None:
+                                level_changes = {}
+                            level_changes[key] = new_levels
+
+            if current is not None:
+                # User-visible control changes are pushed right away; fold
+                # in any coalesced level keys so nothing is lost
+                if self._flush_handle:
+                    self._flush_handle.cancel()
+                    self._flush_handle = None
+                self._pending = None
+                if pending:
+                    current.update(pending)
+                if level_changes:
+                    current.update(level_changes)
                 self.async_set_updated_data(current)
+            elif level_changes is not None:
+                # Pure level frames can arrive tens of times per second;
+                # coalesce them so entities recompute at most once per window.
+                if pending is not None:
+                    pending.update(level_changes)
+                else:
+                    self._pending = level_changes
+                if self._flush_handle is None:
+                    self._flush_handle = self.hass.loop.call_later(
+                        _LEVEL_FLUSH_DELAY, self._flush_levels
+                    )
 
         self._unsubscribe_ws = await self._api.async_subscribe_levels(_levels_callback)
 
+    @callback
+    def _flush_levels(self) -> None:
+        """Merge the coalesced level keys into the live data and push."""
+        self._flush_handle = None
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        # Merge into the data as it is *now* so optimistic writes made
+        # while the flush was pending are preserved
+        current = dict(self.data or _EMPTY)
+        current.update(pending)
+        self.async_set_updated_data(current)
+
     async def async_disconnect(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = None
         if self._unsubscribe_ws:
             self._unsubscribe_ws()
             self._unsubscribe_ws = None
         await self._api.async_disconnect()
 
     def _rounded_levels(self, data: dict[str, Any]) -> dict[str, Any]:
-        def _round_val(val: Any):
-            return int(round(val)) if isinstance(val, (int, float)) else val
-
         rounded_data: dict[str, Any] = {}
         for key, value in data.items():
-            if isinstance(value, (list, tuple)):
-                rounded_data[key] = [_round_val(v) for v in value]
-            elif isinstance(value, dict):
-                rounded_data[key] = {k: _round_val(v) for k, v in value.items()}
+            if key in _LEVEL_KEYS:
+                # Numeric by protocol: coerce to an int tuple in one pass so
+                # entity reads are pure indexed access with no conversion
+                rounded_data[key] = tuple(
+                    int(v + 0.5) if v >= 0 else -int(-v + 0.5) for v in value
+                )
             else:
-                rounded_data[key] = _round_val(value)
+                converter = _ROUND_BY_TYPE.get(type(value), _fast_round)
+                rounded_data[key] = converter(value)
+        outputs = rounded_data.get("outputs")
+        if outputs is not None:
+            rounded_data["outputs_by_index"] = _outputs_by_index(outputs)
         return rounded_data
@@ -13,7 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SOURCES
-from .coordinator import MiniDSPCoordinator
+from .coordinator import MiniDSPCoordinator, get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,8 +34,25 @@ _PRESET_MAP = {
     "Preset 4": 3,
 }
 
+# Reverse maps for O(1) raw-value -> label lookups in state properties
+_SOURCE_REVERSE = {v: k for k, v in _SOURCE_MAP.items()}
+_PRESET_REVERSE = {v: k for k, v in _PRESET_MAP.items()}
+
+# Option lists are static; immutable tuples built once, returned as constants
+_SOURCE_LIST = tuple(_SOURCE_MAP)
+_PRESET_LIST = tuple(_PRESET_MAP)
+
 _MIN_DB = -127.0
 _MAX_DB = 0.0
+# Precomputed scale factors; multiplying by the inverse beats dividing
+_DB_RANGE = _MAX_DB - _MIN_DB
+_INV_DB_RANGE = 1.0 / _DB_RANGE
+
+# Trailing window for coalescing rapid volume up/down presses into one POST
+_VOLUME_FLUSH_DELAY = 0.15
+
+# Shared fallback so missing data never allocates a fresh empty dict per read
+_EMPTY: dict = {}
 
 
 class MiniDSPMediaPlayer(CoordinatorEntity[MiniDSPCoordinator], MediaPlayerEntity):
@@ -55,6 +72,9 @@ class MiniDSPMediaPlayer(CoordinatorEntity[MiniDSPCoordinator], MediaPlayerEntit
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.address}_mediaplayer"
         self._attr_name = coordinator.name or "MiniDSP"
+        # Debounce state for volume up/down bursts
+        self._pending_volume: float | None = None
+        self._volume_flush_handle = None
 
     # ------------------------------------------------------------
     # Properties
@@ -70,84 +90,121 @@ class MiniDSPMediaPlayer(CoordinatorEntity[MiniDSPCoordinator], MediaPlayerEntit
         if gain is None:
             return None
         # Map [_MIN_DB, _MAX_DB] to [0.0, 1.0]
-        return max(0.0, min(1.0, (gain - _MIN_DB) / (_MAX_DB - _MIN_DB)))
+        return max(0.0, min(1.0, (gain - _MIN_DB) * _INV_DB_RANGE))
 
     def _level_to_db(self, level: float) -> float:
-        return (_MAX_DB - _MIN_DB) * level + _MIN_DB
+        return _DB_RANGE * level + _MIN_DB
 
     @property
     def volume_level(self):  # type: ignore[override]
-        gain = (self.coordinator.data or {}).get("master", {}).get("volume")
+        gain = (self.coordinator.data or _EMPTY).get("master", _EMPTY).get("volume")
         return self._db_to_level(gain)
 
     @property
     def is_volume_muted(self):  # type: ignore[override]
-        return (self.coordinator.data or {}).get("master", {}).get("mute")
+        return (self.coordinator.data or _EMPTY).get("master", _EMPTY).get("mute")
 
     @property
     def source(self):  # type: ignore[override]
-        raw = (self.coordinator.data or {}).get("master", {}).get("source")
-        for label, raw_val in _SOURCE_MAP.items():
-            if raw_val == raw:
-                return label
-        return raw
+        raw = (self.coordinator.data or _EMPTY).get("master", _EMPTY).get("source")
+        return _SOURCE_REVERSE.get(raw, raw)
 
     @property
     def source_list(self):  # type: ignore[override]
-        return list(_SOURCE_MAP.keys())
+        return _SOURCE_LIST
 
     @property
     def sound_mode(self):  # type: ignore[override]
-        idx = (self.coordinator.data or {}).get("master", {}).get("preset")
-        for label, val in _PRESET_MAP.items():
-            if val == idx:
-                return label
-        return None
+        idx = (self.coordinator.data or _EMPTY).get("master", _EMPTY).get("preset")
+        return _PRESET_REVERSE.get(idx)
 
     @property
     def sound_mode_list(self):  # type: ignore[override]
-        return list(_PRESET_MAP.keys())
+        return _PRESET_LIST
 
     @property
     def extra_state_attributes(self):
         return {
-            "dirac": (self.coordinator.data or {}).get("master", {}).get("dirac"),
+            "dirac": (self.coordinator.data or _EMPTY).get("master", _EMPTY).get("dirac"),
         }
 
     # ------------------------------------------------------------
     # Commands
     # ------------------------------------------------------------
 
+    def _optimistic_master(self, field: str, value: Any) -> None:
+        """Apply a master_status change locally; the websocket confirms it."""
+        data = dict(self.coordinator.data or _EMPTY)
+        master = dict(data.get("master") or _EMPTY)
+        master[field] = value
+        data["master"] = master
+        self.coordinator.async_set_updated_data(data)
+
     async def async_set_volume_level(self, volume: float):  # type: ignore[override]
         db_gain = self._level_to_db(volume)
         await self.coordinator._api.async_set_volume(db_gain)
-        await self.coordinator.async_request_refresh()
+        self._optimistic_master("volume", db_gain)
 
     async def async_volume_up(self):  # type: ignore[override]
-        if self.volume_level is None:
-            return
-        await self.async_set_volume_level(min(1.0, self.volume_level + 0.05))
+        self._step_volume(0.05)
 
     async def async_volume_down(self):  # type: ignore[override]
-        if self.volume_level is None:
+        self._step_volume(-0.05)
+
+    def _step_volume(self, delta: float) -> None:
+        """Accumulate volume steps and POST only the final value."""
+        base = self._pending_volume
+        if base is None:
+            base = self.volume_level
+        if base is None:
+            return
+        self._pending_volume = max(0.0, min(1.0, base + delta))
+        # Show the stepped value right away; only the last value is sent
+        self._optimistic_master("volume", self._level_to_db(self._pending_volume))
+        if self._volume_flush_handle is None:
+            self._volume_flush_handle = self.hass.loop.call_later(
+                _VOLUME_FLUSH_DELAY,
+                lambda: self.hass.async_create_task(self._flush_volume()),
+            )
+
+    async def _flush_volume(self) -> None:
+        self._volume_flush_handle = None
+        pending = self._pending_volume
+        self._pending_volume = None
+        if pending is None:
             return
-        await self.async_set_volume_level(max(0.0, self.volume_level - 0.05))
+        try:
+            await self.coordinator._api.async_set_volume(self._level_to_db(pending))
+        except Exception as err:  # noqa: BLE001
+            # The optimistic per-press writes are wrong now; re-fetch the
+            # real device state via the shared debounced refresh
+            _LOGGER.warning("Failed to send debounced volume: %s", err)
+            await self.coordinator._refresh_debouncer.async_call()
+
+    async def async_will_remove_from_hass(self) -> None:  # type: ignore[override]
+        # Drop any pending volume flush; firing it after removal would post
+        # through the API of an entry that is already being torn down
+        if self._volume_flush_handle is not None:
+            self._volume_flush_handle.cancel()
+            self._volume_flush_handle = None
+        self._pending_volume = None
+        await super().async_will_remove_from_hass()
 
     async def async_mute_volume(self, mute: bool):  # type: ignore[override]
         await self.coordinator._api.async_set_mute(mute)
-        await self.coordinator.async_request_refresh()
+        self._optimistic_master("mute", mute)
 
     async def async_select_source(self, source: str):  # type: ignore[override]
         api_val = _SOURCE_MAP.get(source, source)
         await self.coordinator._api.async_set_source(api_val)
-        await self.coordinator.async_request_refresh()
+        self._optimistic_master("source", api_val)
 
     async def async_select_sound_mode(self, sound_mode: str):  # type: ignore[override]
         if sound_mode not in _PRESET_MAP:
             _LOGGER.warning("Unknown preset option %s", sound_mode)
             return
         await self.coordinator._api.async_set_preset(_PRESET_MAP[sound_mode])
-        await self.coordinator.async_request_refresh()
+        self._optimistic_master("preset", _PRESET_MAP[sound_mode])
 
     # ------------------------------------------------------------
     @property
@@ -161,8 +218,7 @@ class MiniDSPMediaPlayer(CoordinatorEntity[MiniDSPCoordinator], MediaPlayerEntit
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
-    stored = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    coordinator: MiniDSPCoordinator | None = stored.get("coordinator")
+    coordinator = get_coordinator(hass, entry)
     if coordinator is None:
         _LOGGER.error("Coordinator not found during media_player setup")
         return
@@ -4,14 +4,17 @@ import logging
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MiniDSPCoordinator
+from .coordinator import MiniDSPCoordinator, get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared fallback so missing data never allocates a fresh empty dict per read
+_EMPTY: dict = {}
+
 
 class MiniDSPOutputGain(CoordinatorEntity[MiniDSPCoordinator], NumberEntity):
     """Output channel gain control (-127 to 12 dB)."""
@@ -31,19 +34,30 @@ class MiniDSPOutputGain(CoordinatorEntity[MiniDSPCoordinator], NumberEntity):
 
     @property
     def native_value(self):  # type: ignore[override]
-        # Try to get current gain from outputs data if available
-        outputs = (self.coordinator.data or {}).get("outputs", [])
-        for output in outputs:
-            if output.get("index") == self._output_index:
-                return output.get("gain")
-        return None
+        # O(1) lookup in the index-keyed map maintained by the coordinator
+        output = (
+            (self.coordinator.data or _EMPTY)
+            .get("outputs_by_index", _EMPTY)
+            .get(self._output_index)
+        )
+        return output.get("gain") if output else None
 
     async def async_set_native_value(self, value: float):  # type: ignore[override]
         await self.coordinator._api.async_set_output_gain(
             self._output_index, float(value)
         )
-        # Force refresh to reflect new value
-        await self.coordinator.async_request_refresh()
+        # Optimistically update local state; the websocket confirms it
+        data = dict(self.coordinator.data or _EMPTY)
+        outputs = [dict(o) for o in data.get("outputs", [])]
+        for output in outputs:
+            if output.get("index") == self._output_index:
+                output["gain"] = float(value)
+                break
+        else:
+            outputs.append({"index": self._output_index, "gain": float(value)})
+        data["outputs"] = outputs
+        data["outputs_by_index"] = {o.get("index"): o for o in outputs}
+        self.coordinator.async_set_updated_data(data)
 
     @property
     def device_info(self):  # type: ignore[override]
@@ -56,19 +70,36 @@ class MiniDSPOutputGain(CoordinatorEntity[MiniDSPCoordinator], NumberEntity):
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
-    stored = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    coordinator: MiniDSPCoordinator | None = stored.get("coordinator")
+    coordinator = get_coordinator(hass, entry)
     if coordinator is None:
         _LOGGER.error("Coordinator not found during number platform setup")
         return
 
+    def _add_outputs(num_outputs: int) -> None:
+        # The coordinator already holds fresh data, so skip the per-entity
+        # initial update; a generator avoids materializing the list
+        async_add_entities(
+            (MiniDSPOutputGain(coordinator, i) for i in range(num_outputs)),
+            update_before_add=False,
+        )
+
     # Determine number of output channels from output_levels
-    data = coordinator.data or {}
-    output_levels = data.get("output_levels", [])
-    num_outputs = len(output_levels)
+    data = coordinator.data or _EMPTY
+    output_levels = data.get("output_levels")
+    if output_levels:
+        _add_outputs(len(output_levels))
+        return
+
+    # No channel data yet (first refresh raced the websocket); create the
+    # entities once the next successful update reveals the output count
+    unsub: list = []
 
-    entities = []
-    for i in range(num_outputs):
-        entities.append(MiniDSPOutputGain(coordinator, i))
+    @callback
+    def _async_data_arrived() -> None:
+        late_levels = (coordinator.data or _EMPTY).get("output_levels")
+        if not late_levels:
+            return
+        _add_outputs(len(late_levels))
+        unsub[0]()
 
-    async_add_entities(entities)
+    unsub.append(coordinator.async_add_listener(_async_data_arrived))
@@ -5,66 +5,118 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MiniDSPCoordinator
+from .coordinator import MiniDSPCoordinator, get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class _LevelSensorBase(CoordinatorEntity[MiniDSPCoordinator], SensorEntity):
+    # Slot the per-channel attributes; with dozens of level sensors per
+    # device this trims per-instance memory and speeds up their lookups
+    __slots__ = ("_key", "_index", "_last_state")
+
     _attr_native_unit_of_measurement = "dBFS"
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
-        self, coordinator: MiniDSPCoordinator, name: str, index: int, key: str
+        self,
+        coordinator: MiniDSPCoordinator,
+        name: str,
+        index: int,
+        key: str,
+        device_info: dict[str, Any],
+        unique_id: str,
     ):
         super().__init__(coordinator)
         self._key = key  # "input_levels" or "output_levels"
         self._index = index
-        self._attr_unique_id = f"{coordinator.address}_{key}_{index}"
+        # Pre-built by async_setup_entry to keep f-string work out of the loop
+        self._attr_unique_id = unique_id
         self._attr_name = name
+        # Shared per-device dict built once in async_setup_entry
+        self._attr_device_info = device_info
+        self._last_state: tuple[Any, bool] | None = None
 
     @property
     def native_value(self):  # type: ignore[override]
-        levels: list[Any] | None = (self.coordinator.data or {}).get(self._key)
-        if levels and len(levels) > self._index:
-            try:
-                return int(round(float(levels[self._index])))
-            except (TypeError, ValueError):
-                return None
+        # The coordinator already normalizes level arrays to int tuples at
+        # ingest, so reading is a plain index with a bounds check
+        data = self.coordinator.data
+        if not data:
+            return None
+        levels: tuple[Any, ...] | None = data.get(self._key)
+        if levels and self._index < len(levels):
+            return levels[self._index]
         return None
 
-    @property
-    def device_info(self):  # type: ignore[override]
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.address)},
-            "name": self.coordinator.name,
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Quiet channels repeat the same value across coordinator updates;
+        # skip the state write (recorder insert, websocket broadcast) then.
+        # Availability is part of the pair so failed-refresh/recovery
+        # transitions still write even when the value itself is unchanged.
+        new_state = (self.native_value, self.coordinator.last_update_success)
+        if new_state == self._last_state:
+            return
+        self._last_state = new_state
+        super()._handle_coordinator_update()
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
-    stored = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    coordinator: MiniDSPCoordinator | None = stored.get("coordinator")
+    coordinator = get_coordinator(hass, entry)
     if coordinator is None:
         _LOGGER.error("Coordinator not found during sensor platform setup")
         return
 
+    # One device_info dict shared by every sensor of this device
+    device_info = {
+        "identifiers": {(DOMAIN, coordinator.address)},
+        "name": coordinator.name,
+    }
+
+    def _create_entities(data: dict[str, Any]) -> list[SensorEntity]:
+        entities: list[SensorEntity] = []
+        for key, friendly in (
+            ("input_levels", "Input"),
+            ("output_levels", "Output"),
+        ):
+            uid_base = f"{coordinator.address}_{key}_"
+            entities.extend(
+                _LevelSensorBase(
+                    coordinator,
+                    f"{friendly} Level {idx}",
+                    idx,
+                    key,
+                    device_info,
+                    uid_base + str(idx),
+                )
+                for idx in range(len(data.get(key, ())))
+            )
+        return entities
+
     # Determine how many channels we have based on initial data
     data = coordinator.data or {}
+    if data.get("input_levels") or data.get("output_levels"):
+        async_add_entities(_create_entities(data))
+        return
 
-    entities: list[SensorEntity] = []
+    # No channel data yet (first refresh raced the websocket); add the
+    # sensors once the next successful update reveals the channel counts
+    unsub: list[Any] = []
 
-    for key in ("input_levels", "output_levels"):
-        levels = data.get(key, [])
-        for idx, _ in enumerate(levels):
-            friendly = "Input" if key == "input_levels" else "Output"
-            name = f"{friendly} Level {idx}"
-            entities.append(_LevelSensorBase(coordinator, name, idx, key))
+    @callback
+    def _async_data_arrived() -> None:
+        late_data = coordinator.data or {}
+        if not (late_data.get("input_levels") or late_data.get("output_levels")):
+            return
+        async_add_entities(_create_entities(late_data))
+        unsub[0]()
 
-    async_add_entities(entities)
+    unsub.append(coordinator.async_add_listener(_async_data_arrived))
@@ -4,11 +4,11 @@ import logging
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MiniDSPCoordinator
+from .coordinator import MiniDSPCoordinator, get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +16,8 @@ _LOGGER = logging.getLogger(__name__)
 class DiracLiveSwitch(CoordinatorEntity[MiniDSPCoordinator], SwitchEntity):
     """Switch to enable/disable Dirac Live."""
 
+    __slots__ = ("_last_state",)
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:autorenew"
 
@@ -23,33 +25,64 @@ class DiracLiveSwitch(CoordinatorEntity[MiniDSPCoordinator], SwitchEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.address}_dirac"
         self._attr_name = "Dirac Live"
+        # Built once; avoids a dict + set allocation per registry access
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.address)},
+            "name": coordinator.name,
+        }
+        self._last_state: tuple[bool | None, bool] | None = None
 
     # ---------------------------------------------------------------------
     @property
     def is_on(self):  # type: ignore[override]
-        return (self.coordinator.data or {}).get("master", {}).get("dirac")
+        data = self.coordinator.data
+        if not data:
+            return None
+        # Missing keys are the exceptional case; try/except is free on the
+        # happy path and skips the chained .get fallback dicts
+        try:
+            return data["master"]["dirac"]
+        except (KeyError, TypeError):
+            return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Most coordinator updates are level frames; only write state when
+        # the Dirac bool or the availability flag actually changed
+        new_state = (self.is_on, self.coordinator.last_update_success)
+        if new_state == self._last_state:
+            return
+        self._last_state = new_state
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self):  # type: ignore[override]
-        await self.coordinator._api.async_set_dirac(True)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_dirac(True)
 
     async def async_turn_off(self):  # type: ignore[override]
-        await self.coordinator._api.async_set_dirac(False)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_dirac(False)
 
-    @property
-    def device_info(self):  # type: ignore[override]
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.address)},
-            "name": self.coordinator.name,
-        }
+    async def _async_set_dirac(self, enabled: bool) -> None:
+        """Send the new state and write it through the coordinator cache."""
+        try:
+            await self.coordinator._api.async_set_dirac(enabled)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Failed to set Dirac Live to %s: %s", enabled, err)
+            # Device state is unknown now; fall back to a (debounced) refresh
+            await self.coordinator._refresh_debouncer.async_call()
+            return
+        # We know the value we just set — update the cache directly instead
+        # of re-fetching the whole device state to confirm one bool
+        data = dict(self.coordinator.data or {})
+        master = dict(data.get("master") or {})
+        master["dirac"] = enabled
+        data["master"] = master
+        self.coordinator.async_set_updated_data(data)
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
-    stored = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    coordinator: MiniDSPCoordinator | None = stored.get("coordinator")
+    coordinator = get_coordinator(hass, entry)
     if coordinator is None:
         _LOGGER.error("Coordinator not found during switch platform setup")
         return